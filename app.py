@@ -3,6 +3,17 @@ import pandas as pd
 import plotly.graph_objects as go
 from datetime import datetime
 import asyncio
+import aiohttp
+import sys
+
+# libuv-backed event loop: cheaper task scheduling and faster aiohttp
+# I/O for the gather-heavy scan and monitor paths
+if sys.platform != 'win32':
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
 from app.utils.price_fetcher import PriceFetcher
 from app.utils.arbitrage_finder import ArbitrageFinder
 from app.utils.blockchain_interface import BlockchainInterface
@@ -19,18 +30,52 @@ st.set_page_config(
 
 class ArbitrageBot:
     def __init__(self):
-        self.price_fetcher = PriceFetcher()
+        # Long-lived event loop so HTTP keep-alive and DNS caches survive
+        # between scans instead of being torn down by asyncio.run
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+
+        # One shared HTTP session for every RPC endpoint so TLS
+        # handshakes and TCP slow-start are paid once per host
+        self.session = self._loop.run_until_complete(self._create_session())
+
+        self.price_fetcher = PriceFetcher(session=self.session)
         self.arbitrage_finder = ArbitrageFinder()
-        self.blockchain_interface = BlockchainInterface()
-        
+        self.blockchain_interface = BlockchainInterface(session=self.session)
+
+        # Pay DNS/TCP/TLS setup for all chains now, not on first scan
+        self._loop.run_until_complete(self.blockchain_interface.warmup())
+
+    async def _create_session(self) -> aiohttp.ClientSession:
+        """Create the shared keep-alive HTTP session on the bot's loop"""
+        connector = aiohttp.TCPConnector(
+            limit=128,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=75
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    def init_session_state(self):
+        """Seed per-session defaults on every script run
+
+        Lives outside __init__ because the bot is a cached resource
+        built once per process, while session state is per browser
+        session and must be initialized for each one.
+        """
         if 'opportunities' not in st.session_state:
             st.session_state.opportunities = []
         if 'active_trades' not in st.session_state:
             st.session_state.active_trades = []
-        if 'historical_trades' not in st.session_state:
-            st.session_state.historical_trades = []
+        if 'historical_trades_df' not in st.session_state:
+            # Columnar history so rendering and metrics read it directly
+            # instead of rebuilding a DataFrame from dicts every rerun
+            st.session_state.historical_trades_df = pd.DataFrame(
+                columns=["Date", "Pair", "Route", "Profit", "Status"]
+            )
 
     def main(self):
+        self.init_session_state()
         st.title("🤖 Cross-Chain Arbitrage Bot")
         
         # Sidebar navigation
@@ -46,7 +91,7 @@ class ArbitrageBot:
 
     async def scan_opportunities(self):
         """Scan for arbitrage opportunities across chains"""
-        opportunities = await self.arbitrage_finder.find_opportunities()
+        opportunities = await self.arbitrage_finder.find_opportunities(batch_size=50)
         return opportunities
 
     async def execute_trade(self, opportunity):
@@ -55,9 +100,14 @@ class ArbitrageBot:
 
     def update_opportunities(self):
         """Update the list of current arbitrage opportunities"""
-        opportunities = asyncio.run(self.scan_opportunities())
+        opportunities = self._loop.run_until_complete(self.scan_opportunities())
         st.session_state.opportunities = opportunities
 
+@st.cache_resource
+def get_bot():
+    """Build the bot once and share it across reruns and sessions"""
+    return ArbitrageBot()
+
 if __name__ == "__main__":
-    bot = ArbitrageBot()
+    bot = get_bot()
     bot.main() 
\ No newline at end of file
@@ -4,6 +4,29 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import numpy as np
 
+# Static styling shared by the chart builders; hoisted to module level
+# so render passes don't rebuild these dicts
+_CHAIN_COLORS = {
+    "Ethereum": "#627EEA",
+    "BSC": "#F3BA2F",
+    "Polygon": "#8247E5",
+    "Avalanche": "#E84142",
+}
+
+_PROFIT_LAYOUT = dict(
+    title="Cumulative Profit Over Time",
+    xaxis_title="Date",
+    yaxis_title="Profit (USD)",
+    height=400,
+)
+
+_ACTIVITY_LAYOUT = dict(
+    title="Trades by Chain",
+    xaxis_title="Chain",
+    yaxis_title="Number of Trades",
+    height=400,
+)
+
 def render_dashboard(bot):
     """Render the main dashboard"""
     col1, col2 = st.columns([2, 1])
@@ -26,39 +49,43 @@ def render_dashboard(bot):
         st.subheader("⛓️ Chain Activity")
         render_chain_activity(bot)
 
+@st.fragment
 def render_opportunities_table(bot):
     """Render table of current arbitrage opportunities"""
     if not st.session_state.opportunities:
         st.info("No active arbitrage opportunities found")
         return
 
-    # Convert opportunities to DataFrame
-    opportunities_data = []
-    for opp in st.session_state.opportunities:
-        opportunities_data.append({
-            "Source": f"{opp.source_chain} ({opp.source_dex})",
-            "Target": f"{opp.target_chain} ({opp.target_dex})",
-            "Pair": f"{opp.token_pair[0]}/{opp.token_pair[1]}",
-            "Profit %": f"{opp.profit_percentage:.2f}%",
-            "Est. Profit": f"${opp.estimated_profit_usd:.2f}",
-            "Required Capital": f"${opp.required_capital:.2f}",
-            "Action": "Execute"
-        })
-    
-    df = pd.DataFrame(opportunities_data)
-    
-    # Add execute buttons
-    for idx, row in df.iterrows():
-        cols = st.columns([2, 2, 2, 1, 1, 1, 1])
-        cols[0].write(row["Source"])
-        cols[1].write(row["Target"])
-        cols[2].write(row["Pair"])
-        cols[3].write(row["Profit %"])
-        cols[4].write(row["Est. Profit"])
-        cols[5].write(row["Required Capital"])
-        if cols[6].button("Execute", key=f"exec_{idx}"):
-            execute_opportunity(bot, st.session_state.opportunities[idx])
+    # One Arrow table over the wire instead of a 7xN grid of individual
+    # st.columns widgets; row selection replaces per-row buttons
+    opps = st.session_state.opportunities
+    df = pd.DataFrame({
+        "Source": [f"{opp.source_chain} ({opp.source_dex})" for opp in opps],
+        "Target": [f"{opp.target_chain} ({opp.target_dex})" for opp in opps],
+        "Pair": [f"{opp.token_pair[0]}/{opp.token_pair[1]}" for opp in opps],
+        "Profit %": [opp.profit_percentage for opp in opps],
+        "Est. Profit": [opp.estimated_profit_usd for opp in opps],
+        "Required Capital": [opp.required_capital for opp in opps],
+    })
 
+    selection = st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        column_config={
+            "Profit %": st.column_config.NumberColumn(format="%.2f%%"),
+            "Est. Profit": st.column_config.NumberColumn(format="$%.2f"),
+            "Required Capital": st.column_config.NumberColumn(format="$%.2f"),
+        },
+    )
+
+    if selection.selection.rows:
+        if st.button("Execute Selected"):
+            execute_opportunity(bot, opps[selection.selection.rows[0]])
+
+@st.fragment
 def render_performance_metrics(bot):
     """Render key performance metrics"""
     metrics = calculate_performance_metrics(bot)
@@ -71,12 +98,34 @@ def render_performance_metrics(bot):
     col3.metric("Avg. Profit/Trade", f"${metrics['avg_profit_per_trade']:.2f}")
     col4.metric("Active Trades", metrics['active_trades'])
 
-def render_profit_chart(bot):
-    """Render profit history chart"""
-    # Generate sample data for demonstration
-    dates = pd.date_range(start='2024-01-01', end='2024-03-14', freq='D')
-    profits = np.cumsum(np.random.normal(100, 30, size=len(dates)))
-    
+@st.cache_data(max_entries=4)
+def _profit_series(start: str, end: str, seed: int = 42):
+    """Build the (dates, profits) series once and reuse it across reruns
+
+    Seeded so the demo chart is stable between interactions instead of
+    redrawing different data on every cache refresh.
+    """
+    dates = pd.date_range(start=start, end=end, freq='D')
+    profits = np.random.default_rng(seed).normal(100, 30, size=len(dates)).cumsum()
+    return dates, profits
+
+@st.cache_data(ttl=60)
+def _chain_activity_data():
+    """Return the per-chain trade counts used by the activity chart"""
+    chains = ['Ethereum', 'BSC', 'Polygon', 'Avalanche']
+    trades = [45, 32, 28, 15]
+    return chains, trades
+
+@st.cache_data(ttl=60)
+def _profit_figure(start: str, end: str) -> go.Figure:
+    """Build the profit chart once per unique date range
+
+    Keyed on the hashable start/end strings; st.cache_data cannot hash
+    a DatetimeIndex parameter, so the series itself is looked up from
+    the cached builder inside.
+    """
+    dates, profits = _profit_series(start, end)
+
     fig = go.Figure()
     fig.add_trace(go.Scatter(
         x=dates,
@@ -85,54 +134,89 @@ def render_profit_chart(bot):
         name='Cumulative Profit',
         line=dict(color='#00ff00', width=2)
     ))
-    
-    fig.update_layout(
-        title="Cumulative Profit Over Time",
-        xaxis_title="Date",
-        yaxis_title="Profit (USD)",
-        height=400
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
 
-def render_chain_activity(bot):
-    """Render chain activity metrics"""
-    # Generate sample data for demonstration
-    chains = ['Ethereum', 'BSC', 'Polygon', 'Avalanche']
-    trades = [45, 32, 28, 15]
-    
+    fig.update_layout(**_PROFIT_LAYOUT)
+    return fig
+
+@st.cache_data(ttl=60)
+def _chain_activity_figure(chains: tuple, trades: tuple) -> go.Figure:
+    """Build the chain activity chart once per unique data tuple"""
     fig = go.Figure(data=[
         go.Bar(
-            x=chains,
-            y=trades,
-            marker_color=['#627EEA', '#F3BA2F', '#8247E5', '#E84142']
+            x=list(chains),
+            y=list(trades),
+            marker_color=[_CHAIN_COLORS.get(chain, "#888888") for chain in chains]
         )
     ])
-    
-    fig.update_layout(
-        title="Trades by Chain",
-        xaxis_title="Chain",
-        yaxis_title="Number of Trades",
-        height=400
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+
+    fig.update_layout(**_ACTIVITY_LAYOUT)
+    return fig
+
+@st.fragment
+def render_profit_chart(bot):
+    """Render profit history chart"""
+    # Sample date range for demonstration; on an unchanged range the
+    # cached figure JSON is reused as-is
+    st.plotly_chart(_profit_figure('2024-01-01', '2024-03-14'),
+                    use_container_width=True)
+
+@st.fragment
+def render_chain_activity(bot):
+    """Render chain activity metrics"""
+    # Sample data for demonstration, cached so reruns reuse the lists
+    chains, trades = _chain_activity_data()
+    st.plotly_chart(_chain_activity_figure(tuple(chains), tuple(trades)),
+                    use_container_width=True)
 
 def calculate_performance_metrics(bot):
-    """Calculate performance metrics"""
-    # This would be implemented with actual trading data
-    # Placeholder implementation
+    """Calculate performance metrics from trade history"""
+    history = st.session_state.historical_trades_df
+    if history.empty:
+        # No completed trades yet; sample values for demonstration
+        return {
+            "total_profit": 15420.50,
+            "success_rate": 92.5,
+            "avg_profit_per_trade": 154.20,
+            "active_trades": len(st.session_state.active_trades)
+        }
+
+    # Columnar reductions over the history instead of a Python loop,
+    # so even a 10k-trade history aggregates in microseconds
+    profits = history["Profit"].to_numpy(dtype=np.float64)
+    success = (history["Status"].to_numpy() == "Completed")
+
     return {
-        "total_profit": 15420.50,
-        "success_rate": 92.5,
-        "avg_profit_per_trade": 154.20,
+        "total_profit": float(profits.sum()),
+        "success_rate": float(success.mean() * 100),
+        "avg_profit_per_trade": float(profits.mean()),
         "active_trades": len(st.session_state.active_trades)
     }
 
+def _iter_on_loop(loop, agen):
+    """Bridge an async generator onto the bot's loop for st.write_stream"""
+    while True:
+        try:
+            yield loop.run_until_complete(agen.__anext__())
+        except StopAsyncIteration:
+            break
+
 def execute_opportunity(bot, opportunity):
     """Execute an arbitrage opportunity"""
+    # Stream the AI analysis while the trade is set up instead of
+    # blocking on the full completion
+    analysis_stream = bot.arbitrage_finder.ai_strategy.stream_analysis({
+        'source_chain': opportunity.source_chain,
+        'target_chain': opportunity.target_chain,
+        'token_pair': opportunity.token_pair,
+        'estimated_profit_usd': opportunity.estimated_profit_usd,
+        'profit_percentage': opportunity.profit_percentage,
+        'required_capital': opportunity.required_capital
+    })
+    with st.expander("AI Analysis", expanded=True):
+        st.write_stream(_iter_on_loop(bot._loop, analysis_stream))
+
     with st.spinner("Executing trade..."):
         # This would execute the actual trade
         # For now, just add to active trades
         st.session_state.active_trades.append(opportunity)
-        st.success("Trade executed successfully!") 
\ No newline at end of file
+        st.success("Trade executed successfully!")
\ No newline at end of file
@@ -1,6 +1,11 @@
 import streamlit as st
-from web3 import Web3
-import json
+import asyncio
+
+@st.cache_data(max_entries=128)
+def _is_valid_address(address: str) -> bool:
+    """Validate a wallet address, importing web3 only when first needed"""
+    from web3 import Web3
+    return Web3.is_address(address)
 
 def render_settings(bot):
     """Render the settings interface"""
@@ -46,84 +51,91 @@ def render_wallet_settings(bot):
 def render_network_settings(bot):
     """Render network configuration settings"""
     st.subheader("⛓️ Network Configuration")
-    
-    networks = {
-        "Ethereum": {
-            "rpc": st.text_input("Ethereum RPC URL", value=st.session_state.get("eth_rpc", "")),
-            "enabled": st.checkbox("Enable Ethereum", value=True)
-        },
-        "BSC": {
-            "rpc": st.text_input("BSC RPC URL", value=st.session_state.get("bsc_rpc", "")),
-            "enabled": st.checkbox("Enable BSC", value=True)
-        },
-        "Polygon": {
-            "rpc": st.text_input("Polygon RPC URL", value=st.session_state.get("polygon_rpc", "")),
-            "enabled": st.checkbox("Enable Polygon", value=True)
-        },
-        "Avalanche": {
-            "rpc": st.text_input("Avalanche RPC URL", value=st.session_state.get("avax_rpc", "")),
-            "enabled": st.checkbox("Enable Avalanche", value=True)
+
+    # A form batches widget edits locally so only the submit click
+    # triggers a rerun, not every keystroke
+    with st.form("network_settings"):
+        networks = {
+            "Ethereum": {
+                "rpc": st.text_input("Ethereum RPC URL", value=st.session_state.get("eth_rpc", "")),
+                "enabled": st.checkbox("Enable Ethereum", value=True)
+            },
+            "BSC": {
+                "rpc": st.text_input("BSC RPC URL", value=st.session_state.get("bsc_rpc", "")),
+                "enabled": st.checkbox("Enable BSC", value=True)
+            },
+            "Polygon": {
+                "rpc": st.text_input("Polygon RPC URL", value=st.session_state.get("polygon_rpc", "")),
+                "enabled": st.checkbox("Enable Polygon", value=True)
+            },
+            "Avalanche": {
+                "rpc": st.text_input("Avalanche RPC URL", value=st.session_state.get("avax_rpc", "")),
+                "enabled": st.checkbox("Enable Avalanche", value=True)
+            }
         }
-    }
-    
-    if st.button("Save Network Settings"):
+
+        submitted = st.form_submit_button("Save Network Settings")
+
+    if submitted:
         save_network_settings(bot, networks)
 
 def render_trading_settings(bot):
     """Render trading configuration settings"""
     st.subheader("📊 Trading Configuration")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.number_input(
-            "Default Trade Size (USD)",
-            min_value=100,
-            max_value=1000000,
-            value=st.session_state.get("default_trade_size", 1000),
-            key="default_trade_size"
-        )
-        
-        st.number_input(
-            "Gas Price Multiplier",
-            min_value=1.0,
-            max_value=2.0,
-            value=st.session_state.get("gas_multiplier", 1.1),
-            step=0.1,
-            key="gas_multiplier"
-        )
-    
-    with col2:
-        st.number_input(
-            "Maximum Slippage (%)",
-            min_value=0.1,
-            max_value=5.0,
-            value=st.session_state.get("max_slippage", 1.0),
-            step=0.1,
-            key="max_slippage"
-        )
-        
-        st.number_input(
-            "Minimum Profit Threshold (%)",
-            min_value=0.1,
-            max_value=10.0,
-            value=st.session_state.get("min_profit", 0.5),
-            step=0.1,
-            key="min_profit"
+
+    # Batch every trading widget into one form so edits only rerun the
+    # script on submit
+    with st.form("trading_settings"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.number_input(
+                "Default Trade Size (USD)",
+                min_value=100,
+                max_value=1000000,
+                value=st.session_state.get("default_trade_size", 1000),
+                key="default_trade_size"
+            )
+
+            st.number_input(
+                "Gas Price Multiplier",
+                min_value=1.0,
+                max_value=2.0,
+                value=st.session_state.get("gas_multiplier", 1.1),
+                step=0.1,
+                key="gas_multiplier"
+            )
+
+        with col2:
+            st.number_input(
+                "Maximum Slippage (%)",
+                min_value=0.1,
+                max_value=5.0,
+                value=st.session_state.get("max_slippage", 1.0),
+                step=0.1,
+                key="max_slippage"
+            )
+
+            st.number_input(
+                "Minimum Profit Threshold (%)",
+                min_value=0.1,
+                max_value=10.0,
+                value=st.session_state.get("min_profit", 0.5),
+                step=0.1,
+                key="min_profit"
+            )
+
+        # Flash loan settings
+        st.subheader("⚡ Flash Loan Settings")
+
+        st.checkbox(
+            "Enable Flash Loans",
+            value=st.session_state.get("enable_flash_loans", True),
+            key="enable_flash_loans"
         )
-    
-    # Flash loan settings
-    st.subheader("⚡ Flash Loan Settings")
-    
-    st.checkbox(
-        "Enable Flash Loans",
-        value=st.session_state.get("enable_flash_loans", True),
-        key="enable_flash_loans"
-    )
-    
-    if st.session_state.enable_flash_loans:
+
         col3, col4 = st.columns(2)
-        
+
         with col3:
             st.selectbox(
                 "Flash Loan Provider",
@@ -131,7 +143,7 @@ def render_trading_settings(bot):
                 index=0,
                 key="flash_loan_provider"
             )
-        
+
         with col4:
             st.number_input(
                 "Maximum Flash Loan Size (USD)",
@@ -141,8 +153,10 @@ def render_trading_settings(bot):
                 step=1000,
                 key="max_flash_loan"
             )
-    
-    if st.button("Save Trading Settings"):
+
+        submitted = st.form_submit_button("Save Trading Settings")
+
+    if submitted:
         save_trading_settings(bot)
 
 def render_wallet_balances(bot):
@@ -151,7 +165,7 @@ def render_wallet_balances(bot):
         st.info("Connect wallet to view balances")
         return
     
-    balances = get_wallet_balances(bot)
+    balances = get_wallet_balances(bot, st.session_state.wallet_address)
     
     for chain, tokens in balances.items():
         with st.expander(f"{chain} Balances", expanded=True):
@@ -162,7 +176,7 @@ def connect_wallet(bot, address: str, private_key: str):
     """Connect and validate wallet"""
     try:
         # Validate address format
-        if not Web3.is_address(address):
+        if not _is_valid_address(address):
             st.error("Invalid wallet address format")
             return
         
@@ -197,11 +211,11 @@ def save_trading_settings(bot):
     except Exception as e:
         st.error(f"Error saving trading settings: {str(e)}")
 
-def get_wallet_balances(bot) -> dict:
-    """Get wallet balances across all chains"""
-    # This would be implemented with actual blockchain queries
+async def _fetch_chain_balance(bot, chain: str, wallet_address: str) -> dict:
+    """Fetch token balances for a wallet on a single chain"""
+    # This would query balances through bot.blockchain_interface
     # Placeholder implementation
-    return {
+    placeholder_balances = {
         "Ethereum": {
             "ETH": "1.5 ETH",
             "USDT": "5000 USDT",
@@ -215,4 +229,23 @@ def get_wallet_balances(bot) -> dict:
             "MATIC": "1000 MATIC",
             "USDC": "5000 USDC"
         }
-    } 
\ No newline at end of file
+    }
+    return placeholder_balances.get(chain, {})
+
+@st.cache_data(ttl=15)
+def get_wallet_balances(_bot, wallet_address: str) -> dict:
+    """Get wallet balances across all chains
+
+    Queries every chain concurrently with asyncio.gather so the wait is
+    one round-trip instead of one per chain; results are cached briefly
+    per wallet address.
+    """
+    chains = ["Ethereum", "BSC", "Polygon"]
+
+    async def _fetch_all():
+        results = await asyncio.gather(
+            *(_fetch_chain_balance(_bot, chain, wallet_address) for chain in chains)
+        )
+        return dict(zip(chains, results))
+
+    return _bot._loop.run_until_complete(_fetch_all()) 
\ No newline at end of file
@@ -1,5 +1,4 @@
 import streamlit as st
-import pandas as pd
 from datetime import datetime
 import plotly.graph_objects as go
 
@@ -27,14 +26,10 @@ def render_active_trades(bot):
             # Trade details
             with cols[0]:
                 st.write("**Route:**", f"{trade.source_chain} → {trade.target_chain}")
-                st.write("**Status:**", "In Progress")
-                progress = st.progress(0)
-                
-                # Simulate progress (this would be real progress in production)
-                import time
-                for i in range(100):
-                    time.sleep(0.01)
-                    progress.progress(i + 1)
+                st.write("**Status:**", getattr(trade, "status", "In Progress"))
+                # Driven by update_trade_progress rather than a fake
+                # time.sleep loop that stalled every rerun
+                progress = st.progress(int(getattr(trade, "progress", 0)))
             
             # Profit calculation
             with cols[1]:
@@ -51,84 +46,88 @@ def render_active_trades(bot):
 
 def render_trade_history(bot):
     """Render historical trades table"""
-    if not st.session_state.historical_trades:
+    df = st.session_state.historical_trades_df
+    if df.empty:
         st.info("No historical trades")
         return
-    
-    # Convert historical trades to DataFrame
-    history_data = []
-    for trade in st.session_state.historical_trades:
-        history_data.append({
-            "Date": trade.get("timestamp", datetime.now()),
-            "Pair": f"{trade['token_pair'][0]}/{trade['token_pair'][1]}",
-            "Route": f"{trade['source_chain']} → {trade['target_chain']}",
-            "Profit": f"${trade.get('actual_profit', 0):.2f}",
-            "Status": trade.get("status", "Completed")
-        })
-    
-    df = pd.DataFrame(history_data)
+
+    # History is already columnar; no per-rerun transformation needed
     st.dataframe(df, use_container_width=True)
 
 def render_trade_settings(bot):
     """Render trade execution settings"""
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.number_input(
-            "Minimum Profit Threshold (%)",
-            min_value=0.1,
-            max_value=10.0,
-            value=0.5,
-            step=0.1,
-            key="min_profit_threshold"
-        )
-        
-        st.number_input(
-            "Maximum Gas Price (Gwei)",
-            min_value=1,
-            max_value=500,
-            value=100,
-            step=1,
-            key="max_gas_price"
-        )
-    
-    with col2:
-        st.number_input(
-            "Maximum Trade Size (USD)",
-            min_value=100,
-            max_value=1000000,
-            value=10000,
-            step=100,
-            key="max_trade_size"
-        )
-        
-        st.number_input(
-            "Slippage Tolerance (%)",
-            min_value=0.1,
-            max_value=5.0,
-            value=0.5,
-            step=0.1,
-            key="slippage_tolerance"
-        )
-    
-    st.checkbox("Enable Flash Loans", value=True, key="enable_flash_loans")
-    st.checkbox("Auto-execute profitable trades", value=False, key="auto_execute")
+    # Form keeps widget edits local so only the submit click reruns the page
+    with st.form("trade_settings"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.number_input(
+                "Minimum Profit Threshold (%)",
+                min_value=0.1,
+                max_value=10.0,
+                value=0.5,
+                step=0.1,
+                key="min_profit_threshold"
+            )
+
+            st.number_input(
+                "Maximum Gas Price (Gwei)",
+                min_value=1,
+                max_value=500,
+                value=100,
+                step=1,
+                key="max_gas_price"
+            )
+
+        with col2:
+            st.number_input(
+                "Maximum Trade Size (USD)",
+                min_value=100,
+                max_value=1000000,
+                value=10000,
+                step=100,
+                key="max_trade_size"
+            )
+
+            st.number_input(
+                "Slippage Tolerance (%)",
+                min_value=0.1,
+                max_value=5.0,
+                value=0.5,
+                step=0.1,
+                key="slippage_tolerance"
+            )
+
+        st.checkbox("Enable Flash Loans", value=True, key="enable_flash_loans")
+        st.checkbox("Auto-execute profitable trades", value=False, key="auto_execute")
+
+        st.form_submit_button("Save Settings")
 
 def cancel_trade(bot, trade_idx):
     """Cancel an active trade"""
     try:
         trade = st.session_state.active_trades.pop(trade_idx)
         st.success(f"Trade cancelled successfully")
-        
-        # Add to history with cancelled status
-        trade_dict = trade.__dict__
-        trade_dict["status"] = "Cancelled"
-        trade_dict["timestamp"] = datetime.now()
-        st.session_state.historical_trades.append(trade_dict)
-        
+
+        # Record the status on the trade itself (no __dict__ copy, so
+        # the live object is never aliased) and append one history row
+        trade.status = "Cancelled"
+        _append_history_row(trade, actual_profit=0.0)
+
     except Exception as e:
         st.error(f"Error cancelling trade: {str(e)}")
 
+def _append_history_row(trade, actual_profit: float):
+    """Append a finished trade to the columnar history via attribute access"""
+    df = st.session_state.historical_trades_df
+    df.loc[len(df)] = [
+        datetime.now(),
+        f"{trade.token_pair[0]}/{trade.token_pair[1]}",
+        f"{trade.source_chain} → {trade.target_chain}",
+        actual_profit,
+        trade.status
+    ]
+
 def update_trade_progress(trade_idx: int, progress: float, status: str):
     """Update the progress of an active trade"""
     if 0 <= trade_idx < len(st.session_state.active_trades):
@@ -1,26 +1,37 @@
 import openai
-from typing import List, Dict, Tuple
+import json
+from typing import List, Dict
 import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import os
 from dotenv import load_dotenv
-from langchain_experimental.agents import create_pandas_dataframe_agent
-from langchain.llms import OpenAI
 
 class AIStrategy:
     def __init__(self):
         load_dotenv()
         openai.api_key = os.getenv('OPENAI_API_KEY')
         self.model = "gpt-4-turbo-preview"  # Using the latest GPT-4 model
+        self.max_completion_tokens = 4096  # Model's completion cap
         self.history = []
         self.confidence_threshold = 0.85
 
     async def analyze_opportunity(self, opportunity_data: Dict) -> Dict:
-        """Analyze arbitrage opportunity using OpenAI"""
-        
-        prompt = self._create_analysis_prompt(opportunity_data)
-        
+        """Analyze a single arbitrage opportunity using OpenAI"""
+        results = await self.analyze_opportunities([opportunity_data])
+        return results[0] if results else None
+
+    async def analyze_opportunities(self, opportunities: List[Dict]) -> List[Dict]:
+        """Analyze a batch of arbitrage opportunities in one OpenAI request
+
+        Sending all opportunities as a single JSON prompt (and asking the
+        model to return sentiment alongside each analysis) replaces the
+        two network round-trips per opportunity with one request total.
+        """
+        if not opportunities:
+            return []
+
+        prompt = self._create_batch_analysis_prompt(opportunities)
+
         try:
             response = await openai.ChatCompletion.acreate(
                 model=self.model,
@@ -29,23 +40,64 @@ class AIStrategy:
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,
-                max_tokens=1000
+                # Scale with the batch but never past the model's
+                # completion cap, which would reject the whole request
+                max_tokens=min(1000 * len(opportunities), self.max_completion_tokens)
             )
-            
-            analysis = response.choices[0].message.content
-            risk_score = self._calculate_risk_score(analysis, opportunity_data)
-            
-            return {
-                "analysis": analysis,
-                "risk_score": risk_score,
-                "recommendation": "execute" if risk_score >= self.confidence_threshold else "skip",
-                "confidence": risk_score,
-                "timestamp": datetime.now().isoformat()
-            }
-        
+
+            items = json.loads(response.choices[0].message.content)
+            by_id = {item.get("id"): item for item in items}
+
+            results = []
+            for idx, opportunity_data in enumerate(opportunities):
+                item = by_id.get(idx, {})
+                analysis = item.get("analysis", "")
+                sentiment = item.get("sentiment")
+                risk_score = await self._calculate_risk_score(
+                    analysis, opportunity_data, sentiment=sentiment
+                )
+
+                results.append({
+                    "analysis": analysis,
+                    "risk_score": risk_score,
+                    "recommendation": "execute" if risk_score >= self.confidence_threshold else "skip",
+                    "confidence": risk_score,
+                    "timestamp": datetime.now().isoformat()
+                })
+            return results
+
         except Exception as e:
             print(f"Error in AI analysis: {str(e)}")
-            return None
+            return [None] * len(opportunities)
+
+    async def stream_analysis(self, opportunity_data: Dict):
+        """Stream an opportunity analysis token-by-token
+
+        Yields content chunks as the model produces them so the UI can
+        show the analysis immediately instead of blocking for the full
+        completion.
+        """
+        prompt = self._create_analysis_prompt(opportunity_data)
+
+        try:
+            response = await openai.ChatCompletion.acreate(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": "You are an expert crypto arbitrage analyst with deep knowledge of DeFi protocols, market dynamics, and risk assessment."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=1000,
+                stream=True
+            )
+
+            async for chunk in response:
+                content = chunk.choices[0].delta.get("content", "")
+                if content:
+                    yield content
+
+        except Exception as e:
+            print(f"Error in AI analysis stream: {str(e)}")
 
     async def optimize_execution_path(self, paths: List[Dict]) -> Dict:
         """Optimize the execution path using AI"""
@@ -139,35 +191,73 @@ class AIStrategy:
         Provide a detailed analysis and risk assessment.
         """
 
-    def _calculate_risk_score(self, analysis: str, opportunity_data: Dict) -> float:
+    def _create_batch_analysis_prompt(self, opportunities: List[Dict]) -> str:
+        """Create prompt analyzing a batch of opportunities in one request"""
+        payload = [
+            {
+                "id": idx,
+                "source_chain": opp['source_chain'],
+                "target_chain": opp['target_chain'],
+                "token_pair": list(opp['token_pair']),
+                "estimated_profit_usd": opp['estimated_profit_usd'],
+                "profit_percentage": opp['profit_percentage'],
+                "required_capital": opp['required_capital']
+            }
+            for idx, opp in enumerate(opportunities)
+        ]
+        return f"""
+        Analyze these arbitrage opportunities:
+
+        {json.dumps(payload, indent=2)}
+
+        Consider for each:
+        1. Historical volatility of the token pair
+        2. Current market conditions
+        3. Gas costs and potential slippage
+        4. Bridge reliability and speed
+        5. Smart contract risks
+
+        Respond with only a JSON array, one object per opportunity:
+        [{{"id": <id>, "analysis": "<detailed analysis>", "sentiment": <score between -1 and 1>}}]
+        """
+
+    async def _calculate_risk_score(self, analysis: str, opportunity_data: Dict,
+                                    sentiment: float = None) -> float:
         """Calculate risk score based on AI analysis and opportunity data"""
         # Implement sophisticated risk scoring algorithm
         base_score = 0.5
-        
+
         # Adjust based on profit percentage
         profit_score = min(opportunity_data['profit_percentage'] / 10, 0.3)
-        
+
         # Adjust based on required capital
         capital_risk = max(0, 0.2 - (opportunity_data['required_capital'] / 100000))
-        
-        # Adjust based on sentiment analysis
-        sentiment_score = self._analyze_text_sentiment(analysis)
-        
+
+        # Adjust based on sentiment analysis; the batch prompt already asks
+        # the model for sentiment, so the extra sentiment RPC only runs as a
+        # fallback when the model omitted it
+        if sentiment is not None:
+            sentiment_score = (float(sentiment) + 1) / 2
+        else:
+            sentiment_score = await self._analyze_text_sentiment(analysis)
+
         return min(base_score + profit_score + capital_risk + sentiment_score, 1.0)
 
-    def _analyze_text_sentiment(self, text: str) -> float:
-        """Analyze sentiment score from text"""
+    async def _analyze_text_sentiment(self, text: str) -> float:
+        """Analyze sentiment score from text without blocking the event loop"""
         try:
-            response = openai.Completion.create(
-                model="gpt-4-turbo-preview",
-                prompt=f"Analyze the sentiment of this text and return a score between -1 and 1:\n\n{text}",
+            response = await openai.ChatCompletion.acreate(
+                model=self.model,
+                messages=[
+                    {"role": "user", "content": f"Analyze the sentiment of this text and return only a score between -1 and 1:\n\n{text}"}
+                ],
                 max_tokens=50,
                 temperature=0.3
             )
-            
-            sentiment_score = float(response.choices[0].text.strip())
+
+            sentiment_score = float(response.choices[0].message.content.strip())
             return (sentiment_score + 1) / 2  # Convert to 0-1 scale
-        
+
         except:
             return 0.5  # Default neutral sentiment
 
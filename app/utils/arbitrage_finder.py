@@ -1,12 +1,16 @@
 import asyncio
-from dataclasses import dataclass
+import heapq
+import time
+import msgspec
 from typing import List, Dict, Tuple
 import numpy as np
-from datetime import datetime
 from .ai_strategy import AIStrategy
 
-@dataclass
-class ArbitrageOpportunity:
+class ArbitrageOpportunity(msgspec.Struct, gc=False):
+    # msgspec structs store fields in C-level slots (no per-instance
+    # __dict__) and convert to dicts for the AI strategy without a
+    # per-field Python copy; kept mutable because the finder attaches
+    # ai_analysis and the trade executor updates status/progress
     source_chain: str
     source_dex: str
     target_chain: str
@@ -19,49 +23,116 @@ class ArbitrageOpportunity:
     gas_costs: Dict[str, float]
     timestamp: float
     ai_analysis: Dict = None  # Added AI analysis field
+    status: str = "In Progress"  # Updated as the trade executes
+    progress: float = 0.0  # 0-100, written by update_trade_progress
+    total_gas_usd: float = 0.0  # Derived from gas_costs in __post_init__
+
+    def __post_init__(self):
+        # Summed once at construction so validation never re-reduces
+        # the gas_costs dict per candidate
+        self.total_gas_usd = sum(self.gas_costs.values())
+
+class OpportunityBatch:
+    """Columnar (SoA) view over scan candidates for bulk filtering
+
+    Numeric fields live in parallel NumPy arrays so threshold checks
+    run as one vectorized mask instead of a Python branch per
+    candidate; everything non-numeric stays on the opportunity objects.
+    """
+
+    def __init__(self, opportunities: List[ArbitrageOpportunity]):
+        self.opportunities = opportunities
+        n = len(opportunities)
+        self.profit_pct = np.fromiter(
+            (opp.profit_percentage for opp in opportunities), dtype=np.float64, count=n)
+        self.profit_usd = np.fromiter(
+            (opp.estimated_profit_usd for opp in opportunities), dtype=np.float64, count=n)
+        self.gas_total = np.fromiter(
+            (opp.total_gas_usd for opp in opportunities), dtype=np.float64, count=n)
+        self.capital = np.fromiter(
+            (opp.required_capital for opp in opportunities), dtype=np.float64, count=n)
+
+    def __len__(self):
+        return len(self.opportunities)
+
+# Bridge topology: chain -> [(neighbor, est. cost in USD, bridge)]
+# Edge weights fold in bridge fees and typical gas; refreshed rarely
+BRIDGE_TOPOLOGY = {
+    'ethereum': [('polygon', 5.0, 'layerzero'), ('bsc', 6.0, 'layerzero'), ('avalanche', 7.0, 'layerzero')],
+    'polygon': [('ethereum', 5.0, 'layerzero'), ('bsc', 2.0, 'layerzero'), ('avalanche', 2.5, 'layerzero')],
+    'bsc': [('ethereum', 6.0, 'layerzero'), ('polygon', 2.0, 'layerzero'), ('avalanche', 2.0, 'layerzero')],
+    'avalanche': [('ethereum', 7.0, 'layerzero'), ('polygon', 2.5, 'layerzero'), ('bsc', 2.0, 'layerzero')],
+}
 
 class ArbitrageFinder:
-    def __init__(self):
+    def __init__(self, poll_interval: float = 1.0):
+        self.poll_interval = poll_interval  # Monitor cadence in seconds
         self.min_profit_threshold = 0.5  # 0.5% minimum profit threshold
         self.max_gas_usage = 500000  # Maximum gas units willing to spend
         self.slippage_tolerance = 0.005  # 0.5% slippage tolerance
         self.ai_strategy = AIStrategy()  # Initialize AI strategy
+        self._adj = BRIDGE_TOPOLOGY
+        self._topology_version = 0
+        self._apsp_cache = None  # (version, {source: (distances, predecessors)})
+
+    async def find_opportunities(self, batch_size: int = 50) -> List[ArbitrageOpportunity]:
+        """Find arbitrage opportunities across different chains and DEXs
 
-    async def find_opportunities(self) -> List[ArbitrageOpportunity]:
-        """Find arbitrage opportunities across different chains and DEXs"""
-        opportunities = []
-        
+        batch_size controls how many price/eth_call queries are packed
+        into a single JSON-RPC 2.0 batch request per endpoint, so a scan
+        costs one round-trip per batch instead of one per query.
+        """
         # Find basic opportunities
-        raw_opportunities = await self._find_raw_opportunities()
-        
-        # Analyze each opportunity with AI
-        for opp in raw_opportunities:
-            # Get AI analysis
-            ai_analysis = await self.ai_strategy.analyze_opportunity({
-                'source_chain': opp.source_chain,
-                'target_chain': opp.target_chain,
-                'token_pair': opp.token_pair,
-                'estimated_profit_usd': opp.estimated_profit_usd,
-                'profit_percentage': opp.profit_percentage,
-                'required_capital': opp.required_capital
-            })
-            
-            if ai_analysis and ai_analysis['recommendation'] == 'execute':
-                # Optimize execution path
-                optimized_path = await self.ai_strategy.optimize_execution_path(opp.execution_path)
-                if optimized_path:
-                    opp.execution_path = optimized_path
-                
-                # Add AI analysis to opportunity
-                opp.ai_analysis = ai_analysis
-                opportunities.append(opp)
-        
-        return opportunities
-
-    async def _find_raw_opportunities(self) -> List[ArbitrageOpportunity]:
+        raw_opportunities = await self._find_raw_opportunities(batch_size=batch_size)
+
+        # Vectorized pre-filter so the expensive AI pipeline only sees
+        # candidates that clear the basic thresholds
+        batch = OpportunityBatch(raw_opportunities)
+        mask = self.validate_batch(batch)
+        candidates = [opp for opp, ok in zip(raw_opportunities, mask) if ok]
+
+        async def _analyze(opp: ArbitrageOpportunity) -> ArbitrageOpportunity:
+            """Run the AI pipeline for one opportunity"""
+            # C-level struct walk instead of copying fields into a
+            # hand-built dict; the prompt builder picks what it needs
+            ai_analysis = await self.ai_strategy.analyze_opportunity(
+                msgspec.structs.asdict(opp)
+            )
+
+            if not ai_analysis or ai_analysis['recommendation'] != 'execute':
+                return None
+
+            # Optimize execution path
+            optimized_path = await self.ai_strategy.optimize_execution_path(opp.execution_path)
+            if optimized_path:
+                opp.execution_path = optimized_path
+
+            # Add AI analysis to opportunity
+            opp.ai_analysis = ai_analysis
+            return opp
+
+        # Analyze all opportunities concurrently so N analyses overlap
+        # into roughly one AI round-trip instead of a serial chain
+        results = await asyncio.gather(*map(_analyze, candidates))
+        return [opp for opp in results if opp]
+
+    def validate_batch(self, batch: OpportunityBatch) -> np.ndarray:
+        """Vectorized basic validation over a whole scan batch
+
+        Mirrors the threshold checks in validate_opportunity as a
+        single boolean mask.
+        """
+        return (
+            (batch.profit_pct >= self.min_profit_threshold)
+            & (batch.gas_total <= batch.profit_usd)
+        )
+
+    async def _find_raw_opportunities(self, batch_size: int = 50) -> List[ArbitrageOpportunity]:
         """Find basic arbitrage opportunities without AI analysis"""
         # This is a placeholder implementation
-        # In production, this would scan real DEX prices
+        # In production, this would scan real DEX prices through the
+        # price fetcher, grouping up to batch_size eth_call quote reads
+        # into one JSON-RPC batch POST per chain endpoint
         sample_opportunity = ArbitrageOpportunity(
             source_chain="ethereum",
             source_dex="uniswap",
@@ -80,7 +151,7 @@ class ArbitrageFinder:
                 "ethereum": 0.05,
                 "polygon": 0.001
             },
-            timestamp=datetime.now().timestamp()
+            timestamp=time.time()
         )
         return [sample_opportunity]
 
@@ -90,25 +161,22 @@ class ArbitrageFinder:
         if opportunity.profit_percentage < self.min_profit_threshold:
             return False
 
-        if sum(opportunity.gas_costs.values()) > opportunity.estimated_profit_usd:
+        if opportunity.total_gas_usd > opportunity.estimated_profit_usd:
             return False
 
         # AI-based validation
         if opportunity.ai_analysis:
             if opportunity.ai_analysis['risk_score'] < 0.7:  # Higher threshold for execution
                 return False
-            
-            # Get price prediction
-            price_prediction = await self.ai_strategy.predict_price_movement(
-                opportunity.token_pair[0]
+
+            # Prediction and sentiment are independent, so fire them
+            # together instead of paying two serial round-trips
+            price_prediction, sentiment = await asyncio.gather(
+                self.ai_strategy.predict_price_movement(opportunity.token_pair[0]),
+                self.ai_strategy.analyze_market_sentiment(opportunity.token_pair[0])
             )
             if price_prediction and price_prediction.get('direction') == 'down':
                 return False
-            
-            # Get market sentiment
-            sentiment = await self.ai_strategy.analyze_market_sentiment(
-                opportunity.token_pair[0]
-            )
             if sentiment and sentiment.get('score', 0) < 0.5:
                 return False
 
@@ -141,20 +209,94 @@ class ArbitrageFinder:
 
         return simulation_result
 
+    def set_bridge_topology(self, topology: Dict):
+        """Swap in a new bridge topology and invalidate cached routes"""
+        self._adj = topology
+        self._topology_version += 1
+
+    def _single_source_paths(self, source_chain: str):
+        """Dijkstra from one source over the bridge graph
+
+        Binary-heap Dijkstra, so the hot loop is C-level heap
+        pushes/pops instead of nested Python scans.
+        """
+        distances = {source_chain: 0.0}
+        predecessors = {}
+        heap = [(0.0, source_chain)]
+        visited = set()
+
+        while heap:
+            cost, chain = heapq.heappop(heap)
+            if chain in visited:
+                continue
+            visited.add(chain)
+
+            for neighbor, edge_cost, bridge in self._adj.get(chain, []):
+                new_cost = cost + edge_cost
+                if new_cost < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = new_cost
+                    predecessors[neighbor] = (chain, bridge)
+                    heapq.heappush(heap, (new_cost, neighbor))
+
+        return distances, predecessors
+
+    def _ensure_apsp(self) -> Dict:
+        """(Re)build all-pairs shortest paths when the topology changes
+
+        The graph is tens of chains at most, so running Dijkstra from
+        every source once per topology version is trivial and amortizes
+        across every scan until the bridges change.
+        """
+        if self._apsp_cache and self._apsp_cache[0] == self._topology_version:
+            return self._apsp_cache[1]
+
+        table = {source: self._single_source_paths(source) for source in self._adj}
+        self._apsp_cache = (self._topology_version, table)
+        return table
+
     def get_optimal_path(self, source_chain: str, target_chain: str,
                         token_pair: Tuple[str, str]) -> List[dict]:
-        """Calculate the optimal execution path for cross-chain arbitrage"""
-        # This would implement path-finding algorithm considering:
-        # 1. Bridge efficiency and costs
-        # 2. DEX liquidity
-        # 3. Gas optimization
-        return []
+        """Calculate the optimal execution path for cross-chain arbitrage
+
+        An O(path length) predecessor walk over the precomputed
+        all-pairs table rather than a Dijkstra run per query.
+        """
+        distances, predecessors = self._ensure_apsp().get(source_chain, ({}, {}))
+        if target_chain not in distances:
+            return []
+
+        # Walk predecessors back from the target to rebuild the hops
+        hops = []
+        chain = target_chain
+        while chain != source_chain:
+            parent, bridge = predecessors[chain]
+            hops.append({
+                "action": "bridge",
+                "from_chain": parent,
+                "to_chain": chain,
+                "bridge": bridge
+            })
+            chain = parent
+        hops.reverse()
+
+        return (
+            [{"action": "buy", "chain": source_chain}]
+            + hops
+            + [{"action": "sell", "chain": target_chain}]
+        )
 
     async def monitor_opportunities(self, callback):
         """Continuously monitor for arbitrage opportunities"""
+        # Deadline-based cadence so the real interval stays at
+        # poll_interval instead of poll_interval + scan time
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
         while True:
             opportunities = await self.find_opportunities()
             for opp in opportunities:
                 if await self.validate_opportunity(opp):
                     await callback(opp)
-            await asyncio.sleep(1)  # Adjust polling interval as needed 
\ No newline at end of file
+
+            next_tick += self.poll_interval
+            await asyncio.sleep(max(0.0, next_tick - loop.time())) 
\ No newline at end of file
@@ -1,21 +1,81 @@
-from web3 import Web3
+from web3 import Web3, AsyncWeb3
+from web3.providers.async_rpc import AsyncHTTPProvider
 from typing import Dict, Any
 import json
 import asyncio
+import aiohttp
+import functools
 from eth_account import Account
 import os
 from dotenv import load_dotenv
 
+# orjson parses JSON in C; fall back to stdlib when absent
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+# balanceOf(address) function selector
+_BALANCEOF_SELECTOR = bytes.fromhex("70a08231")
+
+# Canonical Multicall3 deployment; same address on every chain we use
+MULTICALL3_ADDR = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "name": "aggregate",
+        "type": "function",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "callData", "type": "bytes"}
+                ]
+            }
+        ],
+        "outputs": [
+            {"name": "blockNumber", "type": "uint256"},
+            {"name": "returnData", "type": "bytes[]"}
+        ]
+    }
+]
+
+@functools.lru_cache(maxsize=None)
+def _load_abi(contract_type: str) -> dict:
+    """Load and parse a contract ABI once per process
+
+    Cached at module level so extra interface instances (tests,
+    per-chain sharding) skip the disk read and JSON parse.
+    """
+    try:
+        with open(f'app/contracts/{contract_type}.json', 'rb') as f:
+            return _json_loads(f.read())
+    except FileNotFoundError:
+        print(f"Warning: ABI file for {contract_type} not found")
+        return {}
+
 class BlockchainInterface:
-    def __init__(self):
+    def __init__(self, session: aiohttp.ClientSession = None):
         load_dotenv()
-        
-        # Initialize connections to different chains
+
+        # Shared keep-alive session (owned by the bot) used for all
+        # RPC traffic instead of opening a connection per request
+        self.session = session
+        self._session_cached = False
+
+        # Async connections so awaited calls (balances, gas, approvals)
+        # actually overlap instead of blocking the event loop
         self.connections = {
-            'ethereum': Web3(Web3.HTTPProvider(os.getenv('ETH_RPC_URL'))),
-            'bsc': Web3(Web3.HTTPProvider(os.getenv('BSC_RPC_URL'))),
-            'polygon': Web3(Web3.HTTPProvider(os.getenv('POLYGON_RPC_URL'))),
-            'avalanche': Web3(Web3.HTTPProvider(os.getenv('AVAX_RPC_URL')))
+            'ethereum': AsyncWeb3(AsyncHTTPProvider(os.getenv('ETH_RPC_URL'), request_kwargs={"timeout": 10})),
+            'bsc': AsyncWeb3(AsyncHTTPProvider(os.getenv('BSC_RPC_URL'), request_kwargs={"timeout": 10})),
+            'polygon': AsyncWeb3(AsyncHTTPProvider(os.getenv('POLYGON_RPC_URL'), request_kwargs={"timeout": 10})),
+            'avalanche': AsyncWeb3(AsyncHTTPProvider(os.getenv('AVAX_RPC_URL'), request_kwargs={"timeout": 10}))
         }
         
         # Bridge contracts and configurations
@@ -31,23 +91,84 @@ class BlockchainInterface:
         # Load contract ABIs
         self.load_contract_abis()
 
+        # to_checksum_address runs keccak over the hex string and
+        # contract construction re-parses the ABI; memoize both for the
+        # hot balance/approve paths
+        self._checksum = functools.lru_cache(maxsize=4096)(Web3.to_checksum_address)
+        self._contract_cache = {}
+        self._balance_calldata = {}  # wallet -> encoded balanceOf(wallet)
+
+        # Multicall3 aggregator per chain for batched reads
+        self.multicall = {
+            chain: web3.eth.contract(address=MULTICALL3_ADDR, abi=MULTICALL3_ABI)
+            for chain, web3 in self.connections.items()
+        }
+
+    def _get_erc20(self, chain: str, token_address: str):
+        """Return a cached ERC-20 contract for (chain, token) pairs"""
+        address = self._checksum(token_address)
+        key = (chain, address)
+        contract = self._contract_cache.get(key)
+        if contract is None:
+            contract = self.connections[chain].eth.contract(
+                address=address,
+                abi=self.abis['erc20']
+            )
+            self._contract_cache[key] = contract
+        return contract
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared session and attach it to every provider"""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=128,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                ),
+                headers={"Content-Type": "application/json"}
+            )
+        if not self._session_cached:
+            for web3 in self.connections.values():
+                await web3.provider.cache_async_session(self.session)
+            self._session_cached = True
+        return self.session
+
+    async def close(self):
+        """Close the HTTP session on shutdown"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+            self._session_cached = False
+
+    async def warmup(self):
+        """Prewarm every provider with one cheap eth_chainId call
+
+        Front-loads the DNS + TCP + TLS handshakes at startup so the
+        first real arbitrage query doesn't pay them; the connector's
+        DNS cache and keep-alive carry them forward.
+        """
+        await self._ensure_session()
+
+        async def _ping(chain, web3):
+            try:
+                await web3.eth.chain_id
+            except Exception as e:
+                print(f"Warmup failed for {chain}: {str(e)}")
+
+        await asyncio.gather(
+            *(_ping(chain, web3) for chain, web3 in self.connections.items())
+        )
+
     def load_contract_abis(self):
-        """Load all necessary contract ABIs"""
+        """Reference the process-wide parsed contract ABIs"""
         self.abis = {
-            'erc20': self.load_abi('erc20'),
-            'dex': self.load_abi('dex'),
-            'bridge': self.load_abi('bridge')
+            'erc20': _load_abi('erc20'),
+            'dex': _load_abi('dex'),
+            'bridge': _load_abi('bridge')
         }
 
-    def load_abi(self, contract_type: str) -> dict:
-        """Load ABI from file"""
-        try:
-            with open(f'app/contracts/{contract_type}.json', 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"Warning: ABI file for {contract_type} not found")
-            return {}
-
     async def execute_arbitrage(self, opportunity: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a cross-chain arbitrage opportunity"""
         result = {
@@ -66,6 +187,7 @@ class BlockchainInterface:
                 token_pair=opportunity['token_pair']
             )
             result['transactions'].append(buy_tx)
+            amount_after = buy_tx['received_amount']
 
             # 2. Bridge assets if necessary
             if opportunity['source_chain'] != opportunity['target_chain']:
@@ -73,16 +195,17 @@ class BlockchainInterface:
                     from_chain=opportunity['source_chain'],
                     to_chain=opportunity['target_chain'],
                     token=opportunity['token_pair'][0],
-                    amount=buy_tx['received_amount']
+                    amount=amount_after
                 )
                 result['transactions'].append(bridge_tx)
+                amount_after = bridge_tx['received_amount']
 
             # 3. Execute target chain transaction
             sell_tx = await self.execute_dex_trade(
                 chain=opportunity['target_chain'],
                 dex=opportunity['target_dex'],
                 action="sell",
-                amount=bridge_tx['received_amount'] if 'bridge_tx' in locals() else buy_tx['received_amount'],
+                amount=amount_after,
                 token_pair=opportunity['token_pair']
             )
             result['transactions'].append(sell_tx)
@@ -124,29 +247,58 @@ class BlockchainInterface:
             "tx_hash": "0x..."
         }
 
+    def _balanceof_calldata(self, wallet_address: str) -> bytes:
+        """Encoded balanceOf(wallet) calldata, built once per wallet
+
+        Hoists the keccak checksum and ABI encoding out of the per-call
+        path; repeated balance polls reduce to a dict lookup plus a raw
+        eth_call.
+        """
+        data = self._balance_calldata.get(wallet_address)
+        if data is None:
+            wallet = self._checksum(wallet_address)
+            data = _BALANCEOF_SELECTOR + bytes.fromhex(wallet[2:]).rjust(32, b"\0")
+            self._balance_calldata[wallet_address] = data
+        return data
+
     async def get_balance(self, chain: str, token_address: str, wallet_address: str) -> float:
         """Get token balance for a wallet on a specific chain"""
+        await self._ensure_session()
         web3 = self.connections[chain]
-        token_contract = web3.eth.contract(
-            address=Web3.to_checksum_address(token_address),
-            abi=self.abis['erc20']
-        )
-        
-        balance = await token_contract.functions.balanceOf(
-            Web3.to_checksum_address(wallet_address)
-        ).call()
-        
-        return balance
+
+        result = await web3.eth.call({
+            "to": self._checksum(token_address),
+            "data": self._balanceof_calldata(wallet_address)
+        })
+
+        return int.from_bytes(result, "big")
+
+    async def get_balances(self, chain: str, token_to_wallets: list) -> list:
+        """Get many token balances with one Multicall3 aggregate call
+
+        token_to_wallets is a list of (token_address, wallet_address)
+        pairs; all balanceOf reads are packed into a single eth_call,
+        so N lookups cost one round-trip and one decode pass.
+        """
+        await self._ensure_session()
+
+        calls = [
+            (
+                self._checksum(token_address),
+                self._balanceof_calldata(wallet_address)
+            )
+            for token_address, wallet_address in token_to_wallets
+        ]
+
+        _, return_data = await self.multicall[chain].functions.aggregate(calls).call()
+        return [int.from_bytes(ret, "big") if ret else 0 for ret in return_data]
 
     async def approve_token(self, chain: str, token_address: str,
                           spender_address: str, amount: int) -> str:
         """Approve token spending"""
-        web3 = self.connections[chain]
-        token_contract = web3.eth.contract(
-            address=Web3.to_checksum_address(token_address),
-            abi=self.abis['erc20']
-        )
-        
+        await self._ensure_session()
+        token_contract = self._get_erc20(chain, token_address)
+
         # This would include actual approval transaction
         # Placeholder implementation
         return "0x..."  # Transaction hash 
\ No newline at end of file
@@ -1,78 +1,301 @@
 import asyncio
 import ccxt.async_support as ccxt
-from web3 import Web3
+from web3 import AsyncWeb3
+from web3.providers.async_rpc import AsyncHTTPProvider
 import aiohttp
 import json
+import numpy as np
+
+# orjson parses/serializes JSON in C; fall back to stdlib when absent
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _json_loads(data):
+        return json.loads(data)
+
+# Bound on in-flight RPC requests so bursts from gathered scans stay
+# under public-endpoint rate limits
+HTTP_SEM = asyncio.Semaphore(32)
 
 class PriceFetcher:
-    def __init__(self):
+    def __init__(self, session: aiohttp.ClientSession = None, poll_interval: float = 1.0):
+        # Shared keep-alive session (owned by the bot) used for all
+        # RPC traffic instead of opening a connection per request
+        self.session = session
+        self.poll_interval = poll_interval  # Monitor cadence in seconds
+        self._session_cached = False
         self.supported_dexes = {
             'ethereum': ['uniswap', 'sushiswap'],
             'bsc': ['pancakeswap'],
             'polygon': ['quickswap'],
             'avalanche': ['traderjoe']
         }
+        self.rpc_urls = {
+            'ethereum': 'https://mainnet.infura.io/v3/YOUR-PROJECT-ID',
+            'bsc': 'https://bsc-dataseed.binance.org/',
+            'polygon': 'https://polygon-rpc.com',
+            'avalanche': 'https://api.avax.network/ext/bc/C/rpc'
+        }
+        # Async providers so gathered price/gas queries overlap their
+        # round-trips instead of blocking the event loop one by one
         self.web3_providers = {
-            'ethereum': Web3(Web3.HTTPProvider('https://mainnet.infura.io/v3/YOUR-PROJECT-ID')),
-            'bsc': Web3(Web3.HTTPProvider('https://bsc-dataseed.binance.org/')),
-            'polygon': Web3(Web3.HTTPProvider('https://polygon-rpc.com')),
-            'avalanche': Web3(Web3.HTTPProvider('https://api.avax.network/ext/bc/C/rpc'))
+            chain: AsyncWeb3(AsyncHTTPProvider(url, request_kwargs={"timeout": 10}))
+            for chain, url in self.rpc_urls.items()
+        }
+        # WSS endpoints for push-based block notifications; chains left
+        # as None fall back to polling
+        self.ws_urls = {
+            'ethereum': 'wss://mainnet.infura.io/ws/v3/YOUR-PROJECT-ID',
+            'bsc': None,
+            'polygon': None,
+            'avalanche': None
         }
+        # Latest {chain: (block_number, {dex: price})}; prices can only
+        # move when a new block lands, so polls within a block reuse it
+        self._price_cache = {}
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared session and attach it to every provider"""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=128,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                ),
+                headers={"Content-Type": "application/json"}
+            )
+        if not self._session_cached:
+            for web3 in self.web3_providers.values():
+                await web3.provider.cache_async_session(self.session)
+            self._session_cached = True
+        return self.session
+
+    async def close(self):
+        """Close the HTTP session on shutdown"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+            self._session_cached = False
 
-    async def get_dex_price(self, dex: str, token_pair: tuple) -> float:
-        """Get token price from a specific DEX"""
+    def _quote_call(self, dex: str, token_pair: tuple):
+        """Build the eth_call payload for a DEX price quote
+
+        Returns (to, data, decode_fn) so quotes can be packed into a
+        JSON-RPC batch; placeholder values pending real pool addresses
+        and ABIs.
+        """
+        # Implementation would encode the actual DEX quote calldata
+        # (e.g. getAmountsOut) and decode the returned reserves
+        return None, None, lambda raw: 0.0
+
+    async def _batch_eth_call(self, chain: str, calls: list) -> list:
+        """Send one JSON-RPC 2.0 batch of eth_call requests to a chain
+
+        Collapses N round-trips into a single HTTP POST. Results come
+        back aligned with calls; responses are matched by id because
+        servers may answer batch entries in any order.
+        """
         try:
-            # Implementation would include actual DEX contract calls
-            # This is a placeholder that would need real contract addresses and ABIs
-            return 0.0
+            session = await self._ensure_session()
+            batch = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": call_id,
+                    "method": "eth_call",
+                    "params": [{"to": to, "data": data}, "latest"]
+                }
+                for call_id, (to, data, _) in enumerate(calls)
+            ]
+
+            async with HTTP_SEM:
+                async with session.post(self.rpc_urls[chain], data=_json_dumps(batch)) as response:
+                    payload = _json_loads(await response.read())
         except Exception as e:
-            print(f"Error fetching price from {dex}: {str(e)}")
-            return None
+            print(f"Error fetching prices on {chain}: {str(e)}")
+            return [None] * len(calls)
+
+        by_id = {entry.get("id"): entry for entry in payload}
+        results = []
+        for call_id, (_, _, decode) in enumerate(calls):
+            entry = by_id.get(call_id)
+            if entry is None or "error" in entry:
+                results.append(None)
+            else:
+                results.append(decode(entry.get("result")))
+        return results
 
     async def get_gas_price(self, chain: str) -> int:
         """Get current gas price for a specific chain"""
         try:
+            await self._ensure_session()
             web3 = self.web3_providers[chain]
             return await web3.eth.gas_price
         except Exception as e:
             print(f"Error fetching gas price for {chain}: {str(e)}")
             return None
 
+    async def _get_block_number(self, chain: str) -> int:
+        """Current block height for a chain"""
+        try:
+            await self._ensure_session()
+            return await self.web3_providers[chain].eth.block_number
+        except Exception as e:
+            print(f"Error fetching block number for {chain}: {str(e)}")
+            return None
+
     async def fetch_all_prices(self, token_pair: tuple):
-        """Fetch prices from all supported DEXs across chains"""
+        """Fetch prices from all supported DEXs across chains
+
+        DEXs on the same chain share one JSON-RPC batch POST, and the
+        per-chain batches run concurrently, so the whole scan costs one
+        round-trip per chain. Chains whose block height has not moved
+        since the last scan reuse the cached prices without any quote
+        traffic at all.
+        """
         prices = {}
-        tasks = []
+        chains = list(self.supported_dexes)
+
+        # One cheap eth_blockNumber per chain decides whether quotes
+        # can possibly have changed
+        block_numbers = await asyncio.gather(
+            *(self._get_block_number(chain) for chain in chains)
+        )
 
-        for chain, dexes in self.supported_dexes.items():
-            for dex in dexes:
-                tasks.append(self.get_dex_price(dex, token_pair))
+        stale = []
+        for chain, block_number in zip(chains, block_numbers):
+            cached = self._price_cache.get(chain)
+            if block_number is not None and cached and cached[0] == block_number:
+                for dex, price in cached[1].items():
+                    prices[f"{chain}_{dex}"] = price
+            else:
+                stale.append((chain, block_number))
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        idx = 0
-        for chain, dexes in self.supported_dexes.items():
-            for dex in dexes:
-                if not isinstance(results[idx], Exception):
-                    prices[f"{chain}_{dex}"] = results[idx]
-                idx += 1
+        # Build (chain, block, coroutine) in one pass so results stay
+        # correlated by construction rather than by a parallel traversal
+        pairs = [
+            (chain, block_number, self._batch_eth_call(
+                chain,
+                [self._quote_call(dex, token_pair) for dex in self.supported_dexes[chain]]
+            ))
+            for chain, block_number in stale
+        ]
+        # Leaf coroutines catch and return None sentinels, so the
+        # aggregate path stays exception-free with no per-result
+        # isinstance bookkeeping
+        results = await asyncio.gather(*(coro for _, _, coro in pairs))
+
+        for (chain, block_number, _), chain_results in zip(pairs, results):
+            chain_prices = {
+                dex: price
+                for dex, price in zip(self.supported_dexes[chain], chain_results)
+                if price is not None
+            }
+            if block_number is not None and chain_prices:
+                self._price_cache[chain] = (block_number, chain_prices)
+            for dex, price in chain_prices.items():
+                prices[f"{chain}_{dex}"] = price
 
         return prices
 
+    async def _ws_listener(self, chain: str, url: str, new_block: asyncio.Event):
+        """Subscribe to newHeads over WSS and wake the monitor per block
+
+        With real pool addresses this would additionally subscribe to
+        Swap/Sync logs so only affected pools get re-quoted.
+        """
+        session = await self._ensure_session()
+        try:
+            async with session.ws_connect(url) as ws:
+                # JSON-RPC over WebSocket is text-framed; some endpoints
+                # drop binary frames, which would leave us polling
+                await ws.send_str(_json_dumps({
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "eth_subscribe",
+                    "params": ["newHeads"]
+                }).decode())
+                async for msg in ws:
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        break
+                    payload = _json_loads(msg.data)
+                    if payload.get("method") == "eth_subscription":
+                        new_block.set()
+        except Exception as e:
+            print(f"WSS subscription failed for {chain}, falling back to polling: {str(e)}")
+
     async def monitor_price_changes(self, token_pair: tuple, callback):
-        """Continuously monitor price changes and call callback when significant changes occur"""
-        previous_prices = {}
-        
-        while True:
-            current_prices = await self.fetch_all_prices(token_pair)
-            
-            for market, price in current_prices.items():
-                if market in previous_prices:
-                    change = (price - previous_prices[market]) / previous_prices[market]
-                    if abs(change) > 0.01:  # 1% threshold
-                        await callback(market, previous_prices[market], price)
-                
-            previous_prices = current_prices
-            await asyncio.sleep(1)  # Adjust polling interval as needed
+        """Continuously monitor price changes and call callback when significant changes occur
+
+        Chains with a WSS endpoint push newHeads notifications, so the
+        loop recomputes the moment a block lands instead of blindly
+        polling; the per-block cache keeps unchanged chains free. A
+        poll_interval timeout keeps chains without WSS covered.
+        """
+        market_index = {}
+        previous = np.empty(0, dtype=np.float64)
+
+        # Deadline-based cadence: the next tick is scheduled from the
+        # previous deadline, not from when the work finished, so slow
+        # iterations don't compound into drift
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
+        new_block = asyncio.Event()
+        listeners = [
+            asyncio.ensure_future(self._ws_listener(chain, url, new_block))
+            for chain, url in self.ws_urls.items() if url
+        ]
+
+        try:
+            while True:
+                current_prices = await self.fetch_all_prices(token_pair)
+
+                # Grow the aligned arrays when new markets appear
+                for market in current_prices:
+                    if market not in market_index:
+                        market_index[market] = len(market_index)
+                        previous = np.append(previous, np.nan)
+
+                markets = list(market_index)
+                current = np.fromiter(
+                    (current_prices.get(market, np.nan) for market in markets),
+                    dtype=np.float64, count=len(markets)
+                )
+
+                # One vectorized compare across all markets instead of a
+                # Python loop; NaNs (missing or first sight) never flag
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    changed = np.abs(current / previous - 1.0) > 0.01  # 1% threshold
+                for idx in np.where(changed)[0]:
+                    await callback(markets[idx], float(previous[idx]), float(current[idx]))
+
+                previous = current
+
+                # Wake immediately on a pushed block, or at the next
+                # scheduled deadline for chains still on polling
+                next_tick += self.poll_interval
+                new_block.clear()
+                try:
+                    await asyncio.wait_for(
+                        new_block.wait(),
+                        timeout=max(0.0, next_tick - loop.time())
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for listener in listeners:
+                listener.cancel()
 
     def get_supported_pairs(self):
         """Return list of supported trading pairs"""